@@ -0,0 +1,16 @@
+"""
+Analytics modules for the trading system.
+"""
+
+from .options import (
+    bs_price, bs_delta, iv_from_price, iv_from_price_cached,
+    iv_and_delta, iv_and_delta_cached, is_call_type,
+    compute_iv_delta_for_chain, ensure_delta
+)
+
+__all__ = [
+    # Option analytics
+    'bs_price', 'bs_delta', 'iv_from_price', 'iv_from_price_cached',
+    'iv_and_delta', 'iv_and_delta_cached', 'is_call_type',
+    'compute_iv_delta_for_chain', 'ensure_delta'
+]
@@ -0,0 +1,515 @@
+"""
+HDF5 data reader for market data files.
+Provides access to spot, futures, options, and OHLCV datasets stored in
+HDF5, plus helpers to write DataFrames out to HDF5.
+"""
+
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+import h5py
+import numpy as np
+import pandas as pd
+from typing import Dict, List, Optional
+
+
+class H5DataReader:
+    """Reads market data from an HDF5 file.
+
+    Files written by create_h5_from_dataframes carry a 'layout_scheme'
+    attribute naming their path convention; readers then resolve dataset
+    paths directly instead of probing every candidate pattern.
+
+    Intended to be used as a context manager:
+
+        with H5DataReader("market_data.h5") as reader:
+            df = reader.read_spot_series("NIFTY")
+    """
+
+    # Known layout schemes: kind -> dataset path template
+    _PATTERNS = {
+        'v1': {
+            'spot': 'spot/{sym}',
+            'futures': 'futures/{sym}',
+            'options': 'options/{sym}',
+            'ohlcv': 'ohlcv/{sym}/{extra}',
+        },
+    }
+
+    def __init__(self, h5_file_path: str,
+                 rdcc_nbytes: int = 256 * 1024 * 1024,
+                 rdcc_nslots: int = 1_000_003,
+                 rdcc_w0: float = 0.75):
+        """
+        Args:
+            h5_file_path: Path of the HDF5 file to read.
+            rdcc_nbytes: Raw chunk cache size in bytes. The h5py default of
+                1 MiB thrashes on repeated sliced reads of compressed
+                tables; 256 MiB keeps a day's working set of chunks
+                decompressed.
+            rdcc_nslots: Hash slots for the chunk cache; a prime much
+                larger than the cached chunk count minimizes collisions.
+            rdcc_w0: Preemption policy (0 = evict LRU, 1 = evict fully
+                read chunks first).
+        """
+        self.h5_file_path = h5_file_path
+        self._rdcc_nbytes = rdcc_nbytes
+        self._rdcc_nslots = rdcc_nslots
+        self._rdcc_w0 = rdcc_w0
+        self._file: Optional[h5py.File] = None
+        # Resolved dataset paths per (kind, symbol, extra); each candidate
+        # probe walks HDF5's B-tree, so warm lookups skip them entirely
+        self._path_cache: Dict[tuple, str] = {}
+        # (groups, datasets-by-group) built by a single visititems pass,
+        # keyed by the file's (inode, mtime) so a rewritten file rescans
+        self._struct_cache: Optional[tuple] = None
+        # Layout scheme from the file's 'layout_scheme' attribute, or
+        # detected from the first successful candidate probe
+        self._scheme: Optional[str] = None
+
+    def __enter__(self):
+        self._file = h5py.File(self.h5_file_path, 'r',
+                               rdcc_nbytes=self._rdcc_nbytes,
+                               rdcc_nslots=self._rdcc_nslots,
+                               rdcc_w0=self._rdcc_w0)
+        scheme = self._file.attrs.get('layout_scheme')
+        if isinstance(scheme, bytes):
+            scheme = scheme.decode()
+        self._scheme = scheme if scheme in self._PATTERNS else None
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def close(self):
+        """Close the underlying HDF5 file"""
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def _resolve(self, kind: str, symbol: str, extra: Optional[str],
+                 candidates: List[str]) -> Optional[str]:
+        """Resolve a dataset path, probing candidates once per key.
+
+        Args:
+            kind: Data kind ('spot', 'futures', 'options', 'ohlcv').
+            symbol: Instrument symbol.
+            extra: Extra key component (e.g. timeframe), or None.
+            candidates: Candidate paths to probe on a cache miss.
+
+        Returns:
+            Optional[str]: The resolved path, or None if nothing matched.
+        """
+        key = (kind, symbol, extra)
+        path = self._path_cache.get(key)
+        if path is not None:
+            return path
+
+        # With a known scheme, build the canonical path directly - no
+        # failed probes. Scheme comes from the file attribute or from a
+        # previous successful probe.
+        scheme_path = None
+        if self._scheme is not None:
+            fmt = self._PATTERNS[self._scheme].get(kind)
+            if fmt is not None:
+                scheme_path = fmt.format(sym=symbol, extra=extra)
+                if scheme_path in self._file:
+                    self._path_cache[key] = scheme_path
+                    return scheme_path
+
+        for candidate in candidates:
+            if candidate in self._file:
+                self._path_cache[key] = candidate
+                if self._scheme is None:
+                    # Remember which scheme this file follows so later
+                    # lookups skip the candidate loop
+                    for scheme, patterns in self._PATTERNS.items():
+                        fmt = patterns.get(kind)
+                        if fmt and fmt.format(sym=symbol,
+                                              extra=extra) == candidate:
+                            self._scheme = scheme
+                            break
+                return candidate
+        return None
+
+    def read_dataset(self, dataset_path: str) -> np.ndarray:
+        """Read a dataset into a numpy array.
+
+        Preallocates the destination array and uses read_direct, which maps
+        to h5py's fast C copy path instead of the element-wise high-level
+        slicing path - a large win for chunked/compressed datasets.
+
+        Args:
+            dataset_path: Path of the dataset inside the file.
+
+        Returns:
+            np.ndarray: Dataset contents (structured array for tables).
+        """
+        if dataset_path not in self._file:
+            raise KeyError(f"Dataset not found: {dataset_path}")
+        dset = self._file[dataset_path]
+        data = np.empty(dset.shape, dtype=dset.dtype)
+        dset.read_direct(data)
+        return data
+
+    def read_datasets(self, dataset_paths: List[str],
+                      max_workers: Optional[int] = None
+                      ) -> Dict[str, np.ndarray]:
+        """Read several datasets concurrently.
+
+        h5py releases the GIL during reads, so decompression of separate
+        datasets overlaps across threads. File handles aren't
+        thread-safe, so each worker opens its own read-only handle.
+
+        Args:
+            dataset_paths: Paths of the datasets to read.
+            max_workers: Thread count (default: one per dataset, capped
+                at the CPU count).
+
+        Returns:
+            Dict[str, np.ndarray]: Dataset contents keyed by path.
+        """
+        if max_workers is None:
+            max_workers = min(len(dataset_paths), os.cpu_count() or 1)
+        if max_workers <= 1 or len(dataset_paths) <= 1:
+            return {path: self.read_dataset(path) for path in dataset_paths}
+
+        def _read(path: str) -> np.ndarray:
+            with h5py.File(self.h5_file_path, 'r') as f:
+                if path not in f:
+                    raise KeyError(f"Dataset not found: {path}")
+                dset = f[path]
+                data = np.empty(dset.shape, dtype=dset.dtype)
+                dset.read_direct(data)
+                return data
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return dict(zip(dataset_paths,
+                            executor.map(_read, dataset_paths)))
+
+    def _to_dataframe(self, data: np.ndarray) -> pd.DataFrame:
+        """Convert a structured array to a DataFrame, indexing on timestamp.
+
+        Columns are passed as views into the structured array with
+        copy=False instead of letting pd.DataFrame copy every field, and
+        the timestamp index is attached directly rather than through
+        set_index (which copies again to drop the column).
+        """
+        names = data.dtype.names
+        if not names:
+            return pd.DataFrame(data)
+        if 'timestamp' in names:
+            df = pd.DataFrame({n: data[n] for n in names if n != 'timestamp'},
+                              copy=False)
+            ts = data['timestamp']
+            if ts.dtype.kind == 'M':
+                df.index = ts
+            elif ts.dtype == np.int64:
+                # Our writer stores int64 nanoseconds; reinterpreting the
+                # buffer as datetime64[ns] is zero-copy, versus the
+                # per-element dispatch pd.to_datetime does on integers
+                df.index = ts.view('datetime64[ns]')
+            else:
+                df.index = pd.to_datetime(ts)
+            df.index.name = 'timestamp'
+            return df
+        return pd.DataFrame({n: data[n] for n in names}, copy=False)
+
+    def read_spot_series(self, symbol: str) -> pd.DataFrame:
+        """Read the spot price series for a symbol.
+
+        Args:
+            symbol: Instrument symbol.
+
+        Returns:
+            pd.DataFrame: Spot series indexed by timestamp.
+        """
+        path = self._resolve('spot', symbol, None, [
+            f'spot/{symbol}',
+            f'{symbol}/spot',
+            f'data/spot/{symbol}',
+            f'spot_{symbol}',
+        ])
+        if path is None:
+            raise KeyError(f"No spot data found for symbol: {symbol}")
+        return self._to_dataframe(self.read_dataset(path))
+
+    def read_futures_series(self, symbol: str) -> pd.DataFrame:
+        """Read the futures price series for a symbol.
+
+        Args:
+            symbol: Instrument symbol.
+
+        Returns:
+            pd.DataFrame: Futures series indexed by timestamp.
+        """
+        path = self._resolve('futures', symbol, None, [
+            f'futures/{symbol}',
+            f'{symbol}/futures',
+            f'data/futures/{symbol}',
+            f'futures_{symbol}',
+        ])
+        if path is None:
+            raise KeyError(f"No futures data found for symbol: {symbol}")
+        return self._to_dataframe(self.read_dataset(path))
+
+    def read_options_table(self, symbol: str, date_filter=None) -> pd.DataFrame:
+        """Read the options table for a symbol, optionally for a single day.
+
+        Args:
+            symbol: Underlying symbol.
+            date_filter: Optional datetime.date restricting rows to one day.
+
+        Returns:
+            pd.DataFrame: Options table indexed by timestamp.
+        """
+        path = self._resolve('options', symbol, None, [
+            f'options/{symbol}',
+            f'{symbol}/options',
+            f'data/options/{symbol}',
+            f'options_{symbol}',
+        ])
+        if path is None:
+            raise KeyError(f"No options data found for symbol: {symbol}")
+        if date_filter is None:
+            return self._to_dataframe(self.read_dataset(path))
+
+        dset = self._file[path]
+
+        # PyTables-format tables (e.g. written via DataFrame.to_hdf with
+        # format='table') carry an on-disk index; push the date predicate
+        # down so only matching rows are ever read - O(log N) seek
+        # instead of scanning the whole table
+        cls = dset.attrs.get('CLASS')
+        if isinstance(cls, bytes):
+            cls = cls.decode()
+        pandas_type = dset.attrs.get('pandas_type')
+        if isinstance(pandas_type, bytes):
+            pandas_type = pandas_type.decode()
+        if cls == 'TABLE' or pandas_type == 'frame_table':
+            day_start = pd.Timestamp(date_filter)
+            day_end = day_start + pd.Timedelta(days=1)
+            try:
+                return pd.read_hdf(
+                    self.h5_file_path, path,
+                    where=f"index >= Timestamp('{day_start}') "
+                          f"& index < Timestamp('{day_end}')")
+            except ImportError as e:
+                # Keep this an ImportError: callers treat KeyError as
+                # "no data for symbol", which a missing dependency isn't
+                raise ImportError(
+                    f"{path} is a PyTables table; reading it requires "
+                    f"the 'tables' package") from e
+
+        names = dset.dtype.names
+        if names and 'timestamp' in names:
+            # Options tables are time-ordered, so binary-search the
+            # timestamp field for the day bounds and read only that slice -
+            # O(day) decompression instead of loading the whole table.
+            # Reading just the 8-byte timestamp field costs far less than
+            # a full-table load.
+            ts = dset.fields('timestamp')[:]
+            time_sorted = bool(dset.attrs.get('time_sorted', False))
+            if not time_sorted:
+                time_sorted = len(ts) < 2 or bool(np.all(ts[1:] >= ts[:-1]))
+            if time_sorted:
+                day_start = np.int64(pd.Timestamp(date_filter).value)
+                day_end = day_start + np.int64(86_400_000_000_000)
+                lo = int(np.searchsorted(ts, day_start, side='left'))
+                hi = int(np.searchsorted(ts, day_end, side='left'))
+                chunk_rows = dset.chunks[0] if dset.chunks else 0
+                if chunk_rows and hi > lo:
+                    # Align the read to chunk boundaries so HDF5 serves it
+                    # as whole blocks, then trim the edges in memory
+                    start = (lo // chunk_rows) * chunk_rows
+                    stop = min(len(ts),
+                               -(-hi // chunk_rows) * chunk_rows)
+                    block = dset[start:stop][lo - start:hi - start]
+                else:
+                    block = dset[lo:hi]
+                return self._to_dataframe(block)
+
+        # Unsorted fallback: full load then filter. df.index.date would
+        # materialize a Python date object per row; bucketing on int64
+        # nanoseconds stays in vectorized numpy ops
+        df = self._to_dataframe(self.read_dataset(path))
+        if not isinstance(df.index, pd.DatetimeIndex):
+            raise ValueError(
+                f"Cannot apply date_filter: {path} has no timestamp field")
+        day_start = np.int64(pd.Timestamp(date_filter).value)
+        day_end = day_start + np.int64(86_400_000_000_000)
+        idx_ns = df.index.as_unit('ns').asi8
+        return df.iloc[(idx_ns >= day_start) & (idx_ns < day_end)]
+
+    def read_ohlcv_data(self, symbol: str, timeframe: str = '1min') -> pd.DataFrame:
+        """Read OHLCV bars for a symbol and timeframe.
+
+        Args:
+            symbol: Instrument symbol.
+            timeframe: Bar timeframe (e.g. '1min', '5min', '1d').
+
+        Returns:
+            pd.DataFrame: OHLCV bars indexed by timestamp.
+        """
+        path = self._resolve('ohlcv', symbol, timeframe, [
+            f'ohlcv/{symbol}/{timeframe}',
+            f'ohlcv/{timeframe}/{symbol}',
+            f'{symbol}/ohlcv/{timeframe}',
+            f'data/ohlcv/{symbol}/{timeframe}',
+        ])
+        if path is None:
+            raise KeyError(f"No OHLCV data found for {symbol} at {timeframe}")
+        return self._to_dataframe(self.read_dataset(path))
+
+    def _scan(self) -> tuple:
+        """Walk the file structure once, caching groups and datasets.
+
+        A single visititems pass builds both the group list and a
+        per-group dataset map; every structure query afterwards is a dict
+        lookup instead of its own Python/C recursion over the whole file.
+        The cache is keyed by the file's (inode, mtime) so a rewritten
+        file triggers a rescan.
+        """
+        stat = os.stat(self.h5_file_path)
+        key = (stat.st_ino, stat.st_mtime_ns)
+        if self._struct_cache is not None and self._struct_cache[0] == key:
+            return self._struct_cache[1]
+
+        groups: List[str] = []
+        by_group: Dict[str, Dict[str, tuple]] = {'/': {}}
+
+        def _visit(name, obj):
+            if isinstance(obj, h5py.Group):
+                groups.append(name)
+                by_group.setdefault(name, {})
+            else:
+                parent, _, leaf = name.rpartition('/')
+                by_group.setdefault(parent or '/', {})[leaf] = obj.shape
+
+        self._file.visititems(_visit)
+        self._struct_cache = (key, (groups, by_group))
+        return groups, by_group
+
+    def get_groups(self) -> List[str]:
+        """Get all group paths in the file"""
+        return list(self._scan()[0])
+
+    def get_datasets(self, group_path: str = '/') -> List[str]:
+        """Get all dataset paths under a group.
+
+        Args:
+            group_path: Group to search under ('/' for the whole file).
+
+        Returns:
+            List[str]: Dataset paths relative to the file root.
+        """
+        _, by_group = self._scan()
+        base = group_path.strip('/')
+        datasets = []
+        for group, leaves in by_group.items():
+            if base and group != base and not group.startswith(base + '/'):
+                continue
+            prefix = '' if group == '/' else group + '/'
+            datasets.extend(prefix + leaf for leaf in leaves)
+        return datasets
+
+    def get_file_info(self) -> Dict:
+        """Get a summary of the file's groups and datasets"""
+        groups, by_group = self._scan()
+        info = {
+            'file_path': self.h5_file_path,
+            'groups': list(groups),
+            'datasets': {'/': list(by_group.get('/', {}))},
+        }
+        for group in groups:
+            info['datasets'][group] = [f'{group}/{leaf}'
+                                       for leaf in by_group.get(group, {})]
+        return info
+
+    def list_all_data(self) -> Dict[str, Dict[str, tuple]]:
+        """List every dataset in the file with its shape, grouped by parent"""
+        _, by_group = self._scan()
+        return {group: dict(leaves)
+                for group, leaves in by_group.items() if leaves}
+
+
+def _storable_column(values: np.ndarray) -> np.ndarray:
+    """Re-type a column as something h5py can store, if needed"""
+    if values.dtype == object:
+        # Object columns (strings) become fixed-width bytes
+        width = max((len(str(v)) for v in values), default=1)
+        return values.astype(f'S{max(width, 1)}')
+    return values
+
+
+def _df_to_records(df: pd.DataFrame) -> np.ndarray:
+    """Convert a DataFrame to an HDF5-storable structured array.
+
+    Datetime indexes are stored as an int64 nanosecond 'timestamp' field and
+    object columns as fixed-width bytes, since h5py supports neither
+    datetime64 nor Python object dtypes. Columns are assembled with
+    np.rec.fromarrays straight from the frame's arrays, avoiding the
+    df.copy() + to_records path that materialized the data twice.
+    """
+    if isinstance(df.index, pd.DatetimeIndex):
+        # Stored as int64 nanoseconds regardless of the index resolution
+        index_name = 'timestamp'
+        index_values = df.index.to_numpy().astype('datetime64[ns]') \
+                               .astype('int64')
+    else:
+        index_name = df.index.name or 'index'
+        index_values = _storable_column(df.index.to_numpy())
+
+    arrays = [index_values]
+    arrays.extend(_storable_column(df[col].to_numpy()) for col in df.columns)
+    names = [index_name] + [str(col) for col in df.columns]
+    dtype = np.dtype([(name, arr.dtype) for name, arr in zip(names, arrays)])
+    return np.rec.fromarrays(arrays, dtype=dtype)
+
+
+def create_h5_from_dataframes(h5_file_path: str,
+                              dataframes: Dict[str, pd.DataFrame],
+                              compression: str = 'gzip',
+                              block_rows: int = 4096):
+    """Write a mapping of dataset paths to DataFrames into an HDF5 file.
+
+    Time-indexed frames are sorted by timestamp and written in fixed-size
+    row blocks (chunks of block_rows), so a time-sliced read downstream
+    touches a handful of contiguous blocks instead of scattering across
+    arbitrarily chunked data. The block size and sortedness are stamped as
+    dataset attributes for readers to exploit.
+
+    Args:
+        h5_file_path: Output file path.
+        dataframes: Mapping of dataset path (e.g. 'spot/NIFTY') to DataFrame.
+        compression: Compression filter for the datasets.
+        block_rows: Rows per HDF5 chunk.
+    """
+    with h5py.File(h5_file_path, 'w') as f:
+        # Stamp the path convention so readers resolve datasets directly
+        f.attrs['layout_scheme'] = 'v1'
+        for name, df in dataframes.items():
+            time_sorted = isinstance(df.index, pd.DatetimeIndex)
+            if time_sorted and not df.index.is_monotonic_increasing:
+                df = df.sort_index()
+            records = _df_to_records(df)
+            chunks = (min(len(records), block_rows),) if len(records) else None
+            dset = f.create_dataset(name, data=records,
+                                    compression=compression, chunks=chunks)
+            dset.attrs['block_rows'] = block_rows
+            if time_sorted:
+                dset.attrs['time_sorted'] = True
+
+
+def read_h5_to_dataframe(h5_file_path: str, dataset_path: str) -> pd.DataFrame:
+    """Read a single dataset from an HDF5 file into a DataFrame.
+
+    Args:
+        h5_file_path: HDF5 file path.
+        dataset_path: Path of the dataset inside the file.
+
+    Returns:
+        pd.DataFrame: Dataset contents, indexed by timestamp if present.
+    """
+    with H5DataReader(h5_file_path) as reader:
+        return reader._to_dataframe(reader.read_dataset(dataset_path))
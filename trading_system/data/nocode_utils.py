@@ -0,0 +1,125 @@
+"""
+Timestamp lookup helpers for strategy/backtest code.
+"""
+
+import numpy as np
+import pandas as pd
+from collections import OrderedDict
+
+try:
+    from numba import njit
+except ImportError:
+    # numba is optional; without it the kernels below run interpreted
+    def njit(*args, **kwargs):
+        if args and callable(args[0]):
+            return args[0]
+
+        def decorator(func):
+            return func
+        return decorator
+
+# Sorted-unique int64 nanosecond timestamps per DataFrame index. Keyed by
+# id(index) with the index itself kept alongside, both to pin the object
+# (so the id is never recycled while cached) and to verify the hit on
+# lookup. LRU-bounded: a backtest feeding a fresh frame per day/symbol
+# would otherwise pin every index it ever touched.
+_SORTED_TS_CACHE: 'OrderedDict[int, tuple]' = OrderedDict()
+_SORTED_TS_CACHE_MAX = 64
+
+
+def _sorted_ts_for(index: pd.Index) -> np.ndarray:
+    """Get the sorted-unique int64 ns timestamps for an index, cached.
+
+    Building the sorted array is O(N log N); doing it once per index
+    instead of once per lookup is what makes per-tick nearest_ts calls
+    cheap. The least recently used entries are evicted beyond
+    _SORTED_TS_CACHE_MAX.
+    """
+    key = id(index)
+    cached = _SORTED_TS_CACHE.get(key)
+    if cached is not None and cached[0] is index:
+        _SORTED_TS_CACHE.move_to_end(key)
+        return cached[1]
+    arr = np.unique(pd.DatetimeIndex(index).to_numpy()
+                    .astype('datetime64[ns]').astype('int64'))
+    _SORTED_TS_CACHE[key] = (index, arr)
+    _SORTED_TS_CACHE.move_to_end(key)
+    while len(_SORTED_TS_CACHE) > _SORTED_TS_CACHE_MAX:
+        _SORTED_TS_CACHE.popitem(last=False)
+    return arr
+
+
+@njit(cache=True)
+def _nearest_i64(arr, t):
+    """Index of the value in sorted int64 arr closest to t (ties: earlier)"""
+    i = np.searchsorted(arr, t)
+    if i == len(arr):
+        return i - 1
+    if i == 0:
+        return 0
+    if arr[i] - t < t - arr[i - 1]:
+        return i
+    return i - 1
+
+
+@njit(cache=True)
+def _nearest_i64_batch(arr, targets):
+    """Nearest indexes for a whole array of targets in one compiled pass"""
+    out = np.empty(len(targets), dtype=np.int64)
+    n = len(arr)
+    for k in range(len(targets)):
+        t = targets[k]
+        i = np.searchsorted(arr, t)
+        if i == n:
+            out[k] = n - 1
+        elif i == 0:
+            out[k] = 0
+        elif arr[i] - t < t - arr[i - 1]:
+            out[k] = i
+        else:
+            out[k] = i - 1
+    return out
+
+
+def nearest_ts(df: pd.DataFrame, ts) -> pd.Timestamp:
+    """Find the index timestamp closest to ts.
+
+    Binary-searches the cached sorted timestamp array instead of
+    rebuilding a sorted DatetimeIndex per call, so repeated lookups
+    against the same frame are O(log N) with no pandas allocations.
+
+    Args:
+        df: DataFrame with a datetime-like index.
+        ts: Target timestamp (anything pd.Timestamp accepts).
+
+    Returns:
+        pd.Timestamp: The closest timestamp present in df's index.
+    """
+    arr = _sorted_ts_for(df.index)
+    if len(arr) == 0:
+        raise ValueError("nearest_ts called on an empty index")
+    target = np.int64(pd.Timestamp(ts).value)
+    return pd.Timestamp(arr[int(_nearest_i64(arr, target))])
+
+
+def nearest_ts_batch(df: pd.DataFrame, timestamps) -> pd.DatetimeIndex:
+    """Find the closest index timestamp for each of many targets.
+
+    Runs the nearest-neighbor selection as a single (numba-compiled when
+    available) pass over an int64 target array instead of a Python loop
+    of nearest_ts calls.
+
+    Args:
+        df: DataFrame with a datetime-like index.
+        timestamps: Sequence of target timestamps.
+
+    Returns:
+        pd.DatetimeIndex: Closest index timestamp per target, in order.
+    """
+    arr = _sorted_ts_for(df.index)
+    if len(arr) == 0:
+        raise ValueError("nearest_ts_batch called on an empty index")
+    targets = (pd.DatetimeIndex(timestamps).to_numpy()
+               .astype('datetime64[ns]').astype('int64'))
+    picks = _nearest_i64_batch(arr, targets)
+    return pd.DatetimeIndex(arr[picks].astype('datetime64[ns]'))
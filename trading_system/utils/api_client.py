@@ -0,0 +1,125 @@
+"""
+High-level API clients built on the REST client.
+Provides a generic APIClient and a TradingAPIClient with endpoint helpers,
+both backed by a single long-lived pooled session.
+"""
+
+import logging
+from typing import Dict, Any, Optional
+
+from .rest_client import RESTClient, RESTResponse
+
+
+class APIClient:
+    """Generic API client wrapping a long-lived RESTClient.
+
+    The underlying session keeps connections alive, so sequential calls
+    reuse one socket instead of paying a TCP+TLS handshake each time.
+    """
+
+    def __init__(self,
+                 base_url: str,
+                 auth_manager: Optional['AuthManager'] = None,
+                 rate_limiter: Optional['RateLimiter'] = None,
+                 timeout: int = 30,
+                 max_retries: int = 3,
+                 logger: Optional[logging.Logger] = None):
+        """
+        Initialize API client
+
+        Args:
+            base_url: Base URL for all requests
+            auth_manager: Authentication manager instance
+            rate_limiter: Rate limiter instance
+            timeout: Request timeout in seconds
+            max_retries: Maximum number of retries for failed requests
+            logger: Logger instance
+        """
+        self.logger = logger or logging.getLogger(__name__)
+        self.rest_client = RESTClient(
+            base_url=base_url,
+            timeout=timeout,
+            max_retries=max_retries,
+            rate_limiter=rate_limiter,
+            auth_manager=auth_manager,
+            logger=self.logger
+        )
+
+    def get(self, url: str, **kwargs) -> RESTResponse:
+        """Make GET request"""
+        return self.rest_client.get(url, **kwargs)
+
+    def post(self, url: str, **kwargs) -> RESTResponse:
+        """Make POST request"""
+        return self.rest_client.post(url, **kwargs)
+
+    def put(self, url: str, **kwargs) -> RESTResponse:
+        """Make PUT request"""
+        return self.rest_client.put(url, **kwargs)
+
+    def patch(self, url: str, **kwargs) -> RESTResponse:
+        """Make PATCH request"""
+        return self.rest_client.patch(url, **kwargs)
+
+    def delete(self, url: str, **kwargs) -> RESTResponse:
+        """Make DELETE request"""
+        return self.rest_client.delete(url, **kwargs)
+
+    def close(self):
+        """Close the underlying session"""
+        self.rest_client.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+
+class TradingAPIClient(APIClient):
+    """Trading API client with endpoint helpers for common broker operations"""
+
+    def get_account_info(self) -> RESTResponse:
+        """Get account information"""
+        return self.get("/account")
+
+    def get_positions(self) -> RESTResponse:
+        """Get current positions"""
+        return self.get("/positions")
+
+    def submit_order(self, order_data: Dict[str, Any]) -> RESTResponse:
+        """Submit a new order"""
+        return self.post("/orders", json_data=order_data)
+
+    def cancel_order(self, order_id: str) -> RESTResponse:
+        """Cancel an existing order"""
+        return self.delete(f"/orders/{order_id}")
+
+    def get_order_status(self, order_id: str) -> RESTResponse:
+        """Get status of an order"""
+        return self.get(f"/orders/{order_id}")
+
+    def get_market_data(self, symbol: str) -> RESTResponse:
+        """Get current market data for a symbol"""
+        return self.get(f"/market-data/{symbol}")
+
+    def get_historical_data(self, symbol: str, start_date: str,
+                            end_date: str, interval: str = "1d") -> RESTResponse:
+        """Get historical data for a symbol"""
+        return self.get("/historical-data", params={
+            "symbol": symbol,
+            "start_date": start_date,
+            "end_date": end_date,
+            "interval": interval
+        })
+
+
+# Factory functions
+def create_api_client(base_url: str, **kwargs) -> APIClient:
+    """Create a generic API client"""
+    return APIClient(base_url, **kwargs)
+
+
+def create_trading_api_client(base_url: str, **kwargs) -> TradingAPIClient:
+    """Create a trading API client"""
+    return TradingAPIClient(base_url, **kwargs)
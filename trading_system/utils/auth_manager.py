@@ -115,7 +115,11 @@ class OAuth2Auth(AuthManager):
 
 class HMACAuth(AuthManager):
     """HMAC authentication for secure API access"""
-    
+
+    # Signatures embed a timestamp, so headers can't be cached across calls
+    is_per_request_signed = True
+
+
     def __init__(self, 
                  api_key: str, 
                  secret_key: str,
@@ -128,26 +132,36 @@ class HMACAuth(AuthManager):
         self.signature_header = signature_header
         self.timestamp_header = timestamp_header
         self.logger = logging.getLogger(__name__)
-    
+
+        # Precompute the HMAC key schedule (ipad/opad states) once; signing
+        # a request then only hashes the message into copies of these
+        # states instead of re-deriving the padded key per call
+        block_size = hashlib.sha256().block_size
+        key = secret_key.encode('utf-8')
+        if len(key) > block_size:
+            key = hashlib.sha256(key).digest()
+        key = key.ljust(block_size, b'\x00')
+        self._inner = hashlib.sha256(bytes(b ^ 0x36 for b in key))
+        self._outer = hashlib.sha256(bytes(b ^ 0x5C for b in key))
+
     def get_auth_headers(self) -> Dict[str, str]:
         timestamp = str(int(time.time()))
         signature = self._generate_signature(timestamp)
-        
+
         return {
             self.header_name: self.api_key,
             self.signature_header: signature,
             self.timestamp_header: timestamp
         }
-    
+
     def _generate_signature(self, timestamp: str) -> str:
-        """Generate HMAC signature"""
+        """Generate HMAC signature from the precomputed pad states"""
         message = f"{self.api_key}{timestamp}"
-        signature = hmac.new(
-            self.secret_key.encode('utf-8'),
-            message.encode('utf-8'),
-            hashlib.sha256
-        ).hexdigest()
-        return signature
+        inner = self._inner.copy()
+        inner.update(message.encode('utf-8'))
+        outer = self._outer.copy()
+        outer.update(inner.digest())
+        return outer.hexdigest()
     
     def is_authenticated(self) -> bool:
         return bool(self.api_key and self.secret_key)
@@ -12,7 +12,7 @@ from trading_system.utils import (
     # Authentication
     create_api_key_auth, create_bearer_auth, create_hmac_auth,
     # Rate Limiting
-    create_sliding_window_limiter, create_adaptive_limiter,
+    create_token_bucket_limiter, create_adaptive_limiter,
     # API Client
     create_api_client, create_trading_api_client,
     # WebSocket Client
@@ -31,8 +31,8 @@ def example_rest_client():
     # Create authentication
     auth = create_api_key_auth("your-api-key", "X-API-Key")
     
-    # Create rate limiter (100 requests per minute)
-    rate_limiter = create_sliding_window_limiter(100, 60)
+    # Create rate limiter (100 requests per minute, O(1) token bucket)
+    rate_limiter = create_token_bucket_limiter(capacity=100, refill_rate=100 / 60.0)
     
     # Create REST client
     client = create_rest_client(
@@ -163,9 +163,11 @@ def example_websocket_client():
         if ws_client.connect():
             print("Connected to WebSocket")
             
-            # Send some messages
-            ws_client.send_text("Hello WebSocket!")
-            ws_client.send_json({"type": "test", "message": "JSON message"})
+            # Send some messages as a single coalesced frame
+            ws_client.send_batch([
+                ("text", "Hello WebSocket!"),
+                ("json", {"type": "test", "message": "JSON message"})
+            ])
             
             # Wait for responses
             time.sleep(2)
@@ -186,11 +188,14 @@ def example_trading_websocket_client():
     # Create trading WebSocket client
     trading_ws = create_trading_websocket_client("wss://stream.trading.com")
     
+    # Stage subscriptions before connecting; they are flushed as a single
+    # batched frame in the same tick as the connect event, so no server
+    # frames can arrive before the subscriptions are registered
+    trading_ws.subscribe_to_quotes(["AAPL", "MSFT", "GOOGL"])
+    trading_ws.subscribe_to_trades(["AAPL", "MSFT"])
+
     def on_connect():
         print("Trading WebSocket connected!")
-        # Subscribe to quotes and trades
-        trading_ws.subscribe_to_quotes(["AAPL", "MSFT", "GOOGL"])
-        trading_ws.subscribe_to_trades(["AAPL", "MSFT"])
     
     def on_disconnect():
         print("Trading WebSocket disconnected!")
@@ -264,22 +269,22 @@ def example_rate_limiting():
     """Example of different rate limiting strategies"""
     print("\n=== Rate Limiting Example ===")
     
-    # Fixed window rate limiter
-    fixed_limiter = create_sliding_window_limiter(10, 60)  # 10 requests per minute
-    
+    # Token bucket rate limiter (10 requests per minute, burst of 10)
+    bucket_limiter = create_token_bucket_limiter(capacity=10, refill_rate=10 / 60.0)
+
     # Adaptive rate limiter
     adaptive_limiter = create_adaptive_limiter(50, 60, min_requests=1, max_requests=200)
-    
+
     print("Testing rate limiters...")
-    
-    # Test fixed window limiter
+
+    # Test token bucket limiter
     for i in range(15):
-        if fixed_limiter.acquire():
-            print(f"Fixed limiter: Request {i+1} allowed")
+        if bucket_limiter.acquire():
+            print(f"Token bucket: Request {i+1} allowed")
         else:
-            print(f"Fixed limiter: Request {i+1} blocked")
-    
-    print(f"Remaining requests: {fixed_limiter.get_remaining_requests()}")
+            print(f"Token bucket: Request {i+1} blocked")
+
+    print(f"Remaining requests: {bucket_limiter.get_remaining_requests()}")
     
     # Test adaptive limiter
     for i in range(5):
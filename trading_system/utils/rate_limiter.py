@@ -0,0 +1,223 @@
+"""
+Rate limiting utilities for API clients.
+Provides fixed window, sliding window, token bucket, and adaptive strategies.
+"""
+
+import time
+import threading
+import logging
+from collections import deque
+from typing import Optional
+from abc import ABC, abstractmethod
+
+
+class RateLimiter(ABC):
+    """Abstract base class for rate limiters"""
+
+    @abstractmethod
+    def acquire(self, block: bool = False) -> bool:
+        """Acquire a permit for one request.
+
+        Args:
+            block: If True, sleep until a permit is available.
+
+        Returns:
+            bool: True if the request is allowed.
+        """
+        pass
+
+    @abstractmethod
+    def get_remaining_requests(self) -> int:
+        """Get the number of requests currently allowed without waiting"""
+        pass
+
+
+class FixedWindowRateLimiter(RateLimiter):
+    """Fixed window rate limiter - counts requests per aligned window"""
+
+    def __init__(self, max_requests: int, window_seconds: float = 60.0):
+        self.max_requests = max_requests
+        self.window_seconds = window_seconds
+        self._window_start = time.monotonic()
+        self._count = 0
+        self._lock = threading.Lock()
+        self.logger = logging.getLogger(__name__)
+
+    def _roll_window(self, now: float):
+        if now - self._window_start >= self.window_seconds:
+            self._window_start = now
+            self._count = 0
+
+    def acquire(self, block: bool = False) -> bool:
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._roll_window(now)
+                if self._count < self.max_requests:
+                    self._count += 1
+                    return True
+                wait_time = self.window_seconds - (now - self._window_start)
+            if not block:
+                return False
+            self.logger.warning(f"Rate limit reached, sleeping for {wait_time:.2f} seconds")
+            time.sleep(max(wait_time, 0.0))
+
+    def get_remaining_requests(self) -> int:
+        with self._lock:
+            self._roll_window(time.monotonic())
+            return max(0, self.max_requests - self._count)
+
+
+class SlidingWindowRateLimiter(RateLimiter):
+    """Sliding window rate limiter - tracks individual request timestamps"""
+
+    def __init__(self, max_requests: int, window_seconds: float = 60.0):
+        self.max_requests = max_requests
+        self.window_seconds = window_seconds
+        self._request_times = deque()
+        self._lock = threading.Lock()
+        self.logger = logging.getLogger(__name__)
+
+    def _evict(self, now: float):
+        cutoff = now - self.window_seconds
+        while self._request_times and self._request_times[0] <= cutoff:
+            self._request_times.popleft()
+
+    def acquire(self, block: bool = False) -> bool:
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._evict(now)
+                if len(self._request_times) < self.max_requests:
+                    self._request_times.append(now)
+                    return True
+                wait_time = self._request_times[0] + self.window_seconds - now
+            if not block:
+                return False
+            self.logger.warning(f"Rate limit reached, sleeping for {wait_time:.2f} seconds")
+            time.sleep(max(wait_time, 0.0))
+
+    def get_remaining_requests(self) -> int:
+        with self._lock:
+            self._evict(time.monotonic())
+            return max(0, self.max_requests - len(self._request_times))
+
+
+class TokenBucketRateLimiter(RateLimiter):
+    """Token bucket rate limiter - O(1) per acquire.
+
+    Tokens refill continuously at refill_rate per second up to capacity, so
+    bursts up to the bucket size are allowed and each acquire is just two
+    float updates off a monotonic-clock read - no timestamp queue to scan.
+    """
+
+    def __init__(self, capacity: int, refill_rate: float):
+        """
+        Initialize token bucket
+
+        Args:
+            capacity: Maximum number of tokens (burst size)
+            refill_rate: Tokens added per second
+        """
+        self.capacity = capacity
+        self.refill_rate = refill_rate
+        self._tokens = float(capacity)
+        self._last_refill = time.monotonic()
+        self._lock = threading.Lock()
+        self.logger = logging.getLogger(__name__)
+
+    def _refill(self, now: float):
+        self._tokens = min(self.capacity,
+                           self._tokens + (now - self._last_refill) * self.refill_rate)
+        self._last_refill = now
+
+    def acquire(self, block: bool = False) -> bool:
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._refill(now)
+                if self._tokens >= 1.0:
+                    self._tokens -= 1.0
+                    return True
+                wait_time = (1.0 - self._tokens) / self.refill_rate
+            if not block:
+                return False
+            self.logger.warning(f"Rate limit reached, sleeping for {wait_time:.2f} seconds")
+            time.sleep(wait_time)
+
+    def get_remaining_requests(self) -> int:
+        with self._lock:
+            self._refill(time.monotonic())
+            return int(self._tokens)
+
+
+class AdaptiveRateLimiter(SlidingWindowRateLimiter):
+    """Adaptive rate limiter that adjusts its limit from observed latency.
+
+    Starts from an initial requests-per-window limit and grows it while
+    responses stay fast, shrinking it when latency degrades relative to an
+    exponentially weighted moving average of the round-trip time. Averaging
+    (rather than tracking the single best RTT seen) keeps one lucky fast
+    response from permanently dragging the baseline down and causing
+    over-throttling under normally variable latency.
+    """
+
+    # EWMA smoothing factor for the RTT baseline
+    _RTT_ALPHA = 0.1
+
+    def __init__(self, initial_requests: int, window_seconds: float = 60.0,
+                 min_requests: int = 1, max_requests: Optional[int] = None):
+        super().__init__(initial_requests, window_seconds)
+        self.min_requests = min_requests
+        self.max_requests_limit = max_requests or initial_requests * 4
+        self._avg_rtt: Optional[float] = None
+
+    def record_response_time(self, endpoint: str, response_time: float):
+        """Record an observed response time and adapt the request limit.
+
+        Args:
+            endpoint: Endpoint identifier (informational).
+            response_time: Observed round-trip time in seconds.
+        """
+        with self._lock:
+            if self._avg_rtt is None:
+                self._avg_rtt = response_time
+            else:
+                self._avg_rtt = (self._RTT_ALPHA * response_time
+                                 + (1.0 - self._RTT_ALPHA) * self._avg_rtt)
+
+            if response_time > 2.0 * self._avg_rtt:
+                new_limit = max(self.min_requests, int(self.max_requests * 0.8))
+            else:
+                new_limit = min(self.max_requests_limit, self.max_requests + 1)
+
+            if new_limit != self.max_requests:
+                self.logger.debug(
+                    f"Adaptive limit for {endpoint}: {self.max_requests} -> {new_limit}")
+                self.max_requests = new_limit
+
+
+# Factory functions
+def create_fixed_window_limiter(max_requests: int,
+                                window_seconds: float = 60.0) -> FixedWindowRateLimiter:
+    """Create a fixed window rate limiter"""
+    return FixedWindowRateLimiter(max_requests, window_seconds)
+
+
+def create_sliding_window_limiter(max_requests: int,
+                                  window_seconds: float = 60.0) -> SlidingWindowRateLimiter:
+    """Create a sliding window rate limiter"""
+    return SlidingWindowRateLimiter(max_requests, window_seconds)
+
+
+def create_token_bucket_limiter(capacity: int, refill_rate: float) -> TokenBucketRateLimiter:
+    """Create a token bucket rate limiter"""
+    return TokenBucketRateLimiter(capacity, refill_rate)
+
+
+def create_adaptive_limiter(initial_requests: int, window_seconds: float = 60.0,
+                            min_requests: int = 1,
+                            max_requests: Optional[int] = None) -> AdaptiveRateLimiter:
+    """Create an adaptive rate limiter"""
+    return AdaptiveRateLimiter(initial_requests, window_seconds,
+                               min_requests, max_requests)
@@ -6,27 +6,128 @@ Provides connection management, message handling, and reconnection logic.
 import asyncio
 import websockets
 import json
+import os
+import socket
+import struct
 import time
 import threading
 import logging
+import concurrent.futures
+from collections import deque
 from typing import Dict, Any, Optional, Callable, List, Union
-from dataclasses import dataclass
 from datetime import datetime
 from enum import Enum
 import ssl
-from tenacity import retry, stop_after_attempt, wait_exponential, retry_if_exception_type, AsyncRetrying
+from tenacity import retry, stop_after_attempt, wait_random_exponential, retry_if_exception_type, AsyncRetrying
+
+# JSON codec: orjson's C implementation cuts tick-dict serialization cost
+# several-fold. The decode back to str keeps frames textual so the writer
+# can still coalesce them; it's cheap next to the dumps itself.
+try:
+    import orjson
+
+    def _dumps(obj) -> str:
+        return orjson.dumps(obj).decode('utf-8')
+
+    _loads = orjson.loads
+except ImportError:
+    _dumps = json.dumps
+    _loads = json.loads
+
+try:
+    import uvloop
+except ImportError:
+    # uvloop is optional; the stock asyncio loop works everywhere
+    uvloop = None
+
+def build_frame(payload: Union[str, bytes, dict]) -> bytes:
+    """Build a complete masked client-to-server WebSocket frame.
+
+    Intended for fixed-shape messages (pings, subscription acks): the
+    header, mask, and masked payload are assembled once here, and
+    WebSocketClient.send_prebuilt writes the result straight to the
+    transport, skipping the frame writer on every send. dicts are JSON
+    encoded; str becomes a text frame, bytes a binary frame. Prebuilt
+    frames are never compressed (RSV1 clear), which is valid under
+    permessage-deflate.
+    """
+    if isinstance(payload, dict):
+        payload = _dumps(payload)
+    if isinstance(payload, str):
+        opcode = 0x1
+        data = payload.encode('utf-8')
+    else:
+        opcode = 0x2
+        data = payload
+    length = len(data)
+    if length < 126:
+        header = struct.pack('!BB', 0x80 | opcode, 0x80 | length)
+    elif length < 65536:
+        header = struct.pack('!BBH', 0x80 | opcode, 0xFE, length)
+    else:
+        header = struct.pack('!BBQ', 0x80 | opcode, 0xFF, length)
+    mask = os.urandom(4)
+    masked = bytes(b ^ mask[i & 3] for i, b in enumerate(data))
+    return header + mask + masked
+
+
+def enable_wsaccel() -> bool:
+    """Patch websockets' frame masking with wsaccel's C implementation.
+
+    Unmasking runs over every byte of every frame; the pure-Python
+    fallback is a per-byte loop, while wsaccel does a bulk XOR in C.
+    Only patches when websockets is actually on its pure-Python path -
+    builds that ship the library's own C speedups are left alone, as
+    those are already at least as fast. Returns True if the patch was
+    applied; a no-op when wsaccel is not installed.
+    """
+    try:
+        from wsaccel.xormask import XorMaskerSimple
+    except ImportError:
+        return False
+    try:
+        from websockets import frames as _frames
+    except ImportError:
+        return False
+    # websockets falls back to websockets.utils.apply_mask when its own
+    # C extension is unavailable; that's the only case worth patching
+    if getattr(_frames.apply_mask, '__module__', '') != 'websockets.utils':
+        return False
+
+    def _apply_mask(data: bytes, mask: bytes) -> bytes:
+        return XorMaskerSimple(mask).process(data)
+
+    _frames.apply_mask = _apply_mask
+    return True
+
+
+_WSACCEL_ENABLED = enable_wsaccel()
+
+# Shared TLS context for wss:// connections. Building one per connect
+# re-reads and re-parses the CA bundle from disk; sharing it also keeps
+# the TLS session cache warm, so reconnects can resume a session and
+# skip a full handshake round-trip.
+_DEFAULT_SSL_CTX = ssl.create_default_context()
+
+# Freelist of recycled WebSocketMessage instances. At sustained feed
+# rates a fresh allocation per frame churns the allocator and feeds the
+# GC; popping a recycled wrapper is a single deque operation. deque
+# append/popleft are atomic in CPython, so no lock is needed.
+_msg_pool: deque = deque(maxlen=1024)
 
 # Import websockets exceptions properly
 try:
-    from websockets.exceptions import ConnectionClosed, InvalidHandshake, InvalidURI
+    from websockets.exceptions import ConnectionClosed, ConnectionClosedOK, InvalidHandshake, InvalidURI
 except ImportError:
     # Fallback for older versions or different exception structure
     try:
-        from websockets import ConnectionClosed, InvalidHandshake, InvalidURI
+        from websockets import ConnectionClosed, ConnectionClosedOK, InvalidHandshake, InvalidURI
     except ImportError:
         # Define fallback exceptions if websockets doesn't have them
         class ConnectionClosed(Exception):
             pass
+        class ConnectionClosedOK(ConnectionClosed):
+            pass
         class InvalidHandshake(Exception):
             pass
         class InvalidURI(Exception):
@@ -40,21 +141,78 @@ class ConnectionState(Enum):
     RECONNECTING = "reconnecting"
     ERROR = "error"
 
-@dataclass
 class WebSocketMessage:
-    """WebSocket message wrapper"""
-    data: Any
-    message_type: str = "text"
-    timestamp: datetime = None
-    connection_id: Optional[str] = None
-    
-    def __post_init__(self):
-        if self.timestamp is None:
-            self.timestamp = datetime.now()
+    """WebSocket message wrapper.
+
+    Written by hand with __slots__ rather than as a dataclass: one of
+    these is built per received frame, and at feed rates the per-message
+    __dict__ plus an eager datetime.now() dominate the wrapping cost.
+    Arrival time is captured as a cheap time.time() float; the datetime
+    is only materialized if .timestamp is actually read.
+    """
+
+    __slots__ = ('data', 'message_type', 'connection_id',
+                 '_timestamp', '_received_at')
+
+    def __init__(self, data: Any, message_type: str = "text",
+                 timestamp: Optional[datetime] = None,
+                 connection_id: Optional[str] = None):
+        self.data = data
+        self.message_type = message_type
+        self.connection_id = connection_id
+        self._timestamp = timestamp
+        self._received_at = time.time() if timestamp is None else None
+
+    @property
+    def timestamp(self) -> datetime:
+        """Arrival time, materialized as a datetime on first access"""
+        if self._timestamp is None:
+            self._timestamp = datetime.fromtimestamp(self._received_at)
+        return self._timestamp
+
+    @classmethod
+    def _acquire(cls, data: Any, message_type: str,
+                 connection_id: Optional[str]) -> 'WebSocketMessage':
+        """Pop a recycled instance from the freelist, or allocate one.
+
+        All fields are re-initialized, including the cached arrival
+        time, so a recycled wrapper is indistinguishable from a fresh
+        one.
+        """
+        try:
+            msg = _msg_pool.popleft()
+        except IndexError:
+            msg = cls.__new__(cls)
+        msg.data = data
+        msg.message_type = message_type
+        msg.connection_id = connection_id
+        msg._timestamp = None
+        msg._received_at = time.time()
+        return msg
+
+    def release(self):
+        """Return this message to the freelist for reuse.
+
+        Only call this once the message (and its data) will not be
+        touched again; the instance may be handed to the next frame
+        immediately.
+        """
+        self.data = None
+        _msg_pool.append(self)
+
+    def __repr__(self):
+        return (f"WebSocketMessage(data={self.data!r}, "
+                f"message_type={self.message_type!r}, "
+                f"timestamp={self.timestamp!r}, "
+                f"connection_id={self.connection_id!r})")
 
 class WebSocketClient:
     """Generic WebSocket client with reconnection and message handling"""
-    
+
+    # Maximum messages coalesced into one outgoing frame by the writer
+    _MAX_TX_BATCH = 64
+
+
     def __init__(self, 
                  uri: str,
                  auto_reconnect: bool = True,
@@ -63,6 +221,13 @@ class WebSocketClient:
                  max_reconnect_delay: float = 60.0,
                  ping_interval: float = 20.0,
                  ping_timeout: float = 10.0,
+                 compression: Optional[str] = 'deflate',
+                 piggyback_ping: bool = False,
+                 max_message_size: int = 2 ** 22,
+                 send_queue_maxlen: int = 1000,
+                 decode: bool = True,
+                 recycle_messages: bool = False,
+                 manager: Optional['WebSocketClientManager'] = None,
                  logger: Optional[logging.Logger] = None):
         """
         Initialize WebSocket client
@@ -75,6 +240,30 @@ class WebSocketClient:
             max_reconnect_delay: Maximum delay between reconnection attempts
             ping_interval: Interval for ping messages
             ping_timeout: Timeout for ping responses
+            piggyback_ping: When True, disable the websockets keepalive
+                task and let the writer emit a ping only after the send
+                side has been idle for ping_interval. App traffic
+                already proves liveness, so chatty clients send no
+                keepalive frames at all
+            compression: 'deflate' to negotiate permessage-deflate (the
+                repetitive keys in market-data JSON compress 5-10x), or
+                None to trade bandwidth for CPU on latency-critical
+                direct feeds
+            max_message_size: Maximum size of an incoming message
+            send_queue_maxlen: Bound of the offline send queue; the
+                oldest queued messages are dropped when it overflows
+            decode: When False, skip the UTF-8 decode of incoming text
+                frames and deliver raw bytes (message_type 'binary').
+                Binary feeds never needed the decode, and for JSON feeds
+                orjson.loads(bytes) beats json.loads(str) anyway
+            recycle_messages: When True, message wrappers are drawn from
+                a freelist and recycled as soon as the callback returns.
+                Only safe if the callback never retains the message (or
+                its data) past its own return
+            manager: Shared WebSocketClientManager to host this client.
+                When given, connect() runs the client as a task on the
+                manager's event loop instead of spawning a dedicated
+                thread, so many clients share one loop
             logger: Logger instance
         """
         self.uri = uri
@@ -84,6 +273,12 @@ class WebSocketClient:
         self.max_reconnect_delay = max_reconnect_delay
         self.ping_interval = ping_interval
         self.ping_timeout = ping_timeout
+        self.piggyback_ping = piggyback_ping
+        self.compression = compression
+        self.max_message_size = max_message_size
+        self.decode = decode
+        self.recycle_messages = recycle_messages
+        self.manager = manager
         self.logger = logger or logging.getLogger(__name__)
         
         # Connection state
@@ -107,10 +302,29 @@ class WebSocketClient:
         self._thread = None
         self._stop_event = threading.Event()
         self._reconnect_task = None
+        # Signaled by the loop thread when the connection attempt
+        # resolves, so connect() can block on it instead of polling
+        self._connected_fut: Optional[concurrent.futures.Future] = None
+        # Handle on _connect_and_run when hosted by a manager
+        self._run_fut: Optional[concurrent.futures.Future] = None
         
-        # Message queue for reconnection
-        self._message_queue: List[Any] = []
-        self._queue_lock = threading.Lock()
+        # Bounded backlog for messages sent while disconnected. A deque
+        # with maxlen drops the oldest entries on overflow (stale ticks
+        # are useless after an outage anyway) and its append/popleft are
+        # atomic in CPython, so the send path needs no lock
+        self._message_queue: deque = deque(maxlen=send_queue_maxlen)
+
+        # Outgoing buffer, appended to by caller threads and swapped out
+        # wholesale by the writer coroutine. The wakeup event is created
+        # inside the event loop per connection; senders only schedule a
+        # wakeup when the buffer transitions from empty, so a burst costs
+        # one cross-thread callback instead of one per message
+        self._tx_buf: deque = deque()
+        self._tx_lock = threading.Lock()
+        self._tx_wakeup: Optional[asyncio.Event] = None
+
+        # Pre-serialized payloads, keyed by name (see register_template)
+        self._templates: Dict[str, str] = {}
     
     def set_on_connect(self, callback: Callable):
         """Set connection callback"""
@@ -144,19 +358,54 @@ class WebSocketClient:
         
         self.state = ConnectionState.CONNECTING
         self._stop_event.clear()
-        
-        # Start event loop in separate thread
-        self._thread = threading.Thread(target=self._run_event_loop, daemon=True)
-        self._thread.start()
-        
-        # Wait for connection
-        timeout = 10
-        start_time = time.time()
-        while self.state == ConnectionState.CONNECTING and (time.time() - start_time) < timeout:
-            time.sleep(0.1)
-        
-        return self.state == ConnectionState.CONNECTED
+        self._connected_fut = concurrent.futures.Future()
+
+        if self.manager is not None:
+            # Run on the manager's shared loop instead of a dedicated
+            # thread; one loop thread hosts any number of clients
+            self._loop = self.manager._ensure_loop()
+            self._run_fut = asyncio.run_coroutine_threadsafe(
+                self._connect_and_run(), self._loop)
+            # If the run ends without ever connecting, unblock connect()
+            self._run_fut.add_done_callback(
+                lambda _fut: self._signal_connect_result(False))
+        else:
+            # Start event loop in separate thread
+            self._thread = threading.Thread(target=self._run_event_loop, daemon=True)
+            self._thread.start()
+
+        # Block until the loop thread resolves the attempt; returns the
+        # moment the handshake completes instead of on a poll tick
+        try:
+            return bool(self._connected_fut.result(timeout=10))
+        except concurrent.futures.TimeoutError:
+            return self.state == ConnectionState.CONNECTED
     
+    async def async_connect(self):
+        """Run the client on the caller's running event loop.
+
+        Avoids the dedicated loop thread entirely: sends from coroutines
+        on the same loop skip every cross-thread hop, and many clients
+        can share one loop. Runs until the connection ends (schedule with
+        asyncio.create_task to run it in the background); the threaded
+        connect() remains for synchronous callers.
+        """
+        if self.state in (ConnectionState.CONNECTED,
+                          ConnectionState.CONNECTING):
+            self.logger.warning("Already connected or connecting")
+            return
+        self.state = ConnectionState.CONNECTING
+        self._stop_event.clear()
+        self._loop = asyncio.get_running_loop()
+        await self._connect_and_run()
+
+    async def async_disconnect(self):
+        """Disconnect a client started with async_connect"""
+        self.logger.info("Disconnecting from WebSocket")
+        self.state = ConnectionState.DISCONNECTED
+        self._stop_event.set()
+        await self._close_connection()
+
     def disconnect(self):
         """Disconnect from WebSocket server"""
         self.logger.info("Disconnecting from WebSocket")
@@ -165,50 +414,176 @@ class WebSocketClient:
         
         if self._loop and not self._loop.is_closed():
             asyncio.run_coroutine_threadsafe(self._close_connection(), self._loop)
-        
+
+        if self.manager is not None:
+            # The loop thread is shared; wait for this client's task only
+            if self._run_fut is not None:
+                try:
+                    self._run_fut.result(timeout=5.0)
+                except Exception:
+                    pass
+                self._run_fut = None
+            return
+
         if self._thread and self._thread.is_alive():
             self._thread.join(timeout=5.0)
     
-    def send(self, message: Union[str, dict, bytes]) -> bool:
-        """Send message to WebSocket server"""
+    def _enqueue_tx(self, message: Union[str, bytes]) -> bool:
+        """Hand an already-encoded message to the writer coroutine"""
         if self.state != ConnectionState.CONNECTED:
             self.logger.warning("Not connected, queuing message")
-            with self._queue_lock:
-                self._message_queue.append(message)
+            self._message_queue.append(message)
             return False
-        
+
+        loop = self._loop
+        wakeup = self._tx_wakeup
+        if loop and not loop.is_closed() and wakeup is not None:
+            with self._tx_lock:
+                self._tx_buf.append(message)
+                need_wake = len(self._tx_buf) == 1
+            if need_wake:
+                # Only the empty->non-empty transition needs to poke the
+                # loop; the writer drains everything it finds. When the
+                # caller is already on the client's loop (async_connect
+                # usage) the event can be set directly - no cross-thread
+                # callback at all.
+                try:
+                    running = asyncio.get_running_loop()
+                except RuntimeError:
+                    running = None
+                if running is loop:
+                    wakeup.set()
+                else:
+                    loop.call_soon_threadsafe(wakeup.set)
+            return True
+        self.logger.error("Event loop not available")
+        return False
+
+    def send(self, message: Union[str, dict, bytes]) -> bool:
+        """Send message to WebSocket server.
+
+        Generic entry point that probes the message type; callers that
+        know what they're sending should prefer send_json/send_text/
+        send_binary, which skip the isinstance chain.
+        """
         try:
             if isinstance(message, dict):
-                message = json.dumps(message)
+                message = _dumps(message)
             elif isinstance(message, bytes):
                 pass  # Send as binary
             else:
                 message = str(message)
-            
-            if self._loop and not self._loop.is_closed():
-                asyncio.run_coroutine_threadsafe(self._send_message(message), self._loop)
-                return True
-            else:
-                self.logger.error("Event loop not available")
-                return False
-                
+            return self._enqueue_tx(message)
         except Exception as e:
             self.logger.error(f"Failed to send message: {e}")
             if self.on_error:
                 self.on_error(e)
             return False
     
+    def send_batch(self, items: List[tuple], max_batch_bytes: int = 16384) -> bool:
+        """Send multiple messages coalesced into newline-delimited frames.
+
+        Each back-to-back send() pays its own framing and syscall; packing
+        several small payloads into one frame amortizes that cost. Frames
+        are filled greedily up to max_batch_bytes.
+
+        Args:
+            items: Sequence of (kind, payload) tuples where kind is 'text'
+                or 'json'.
+            max_batch_bytes: Maximum size of a single coalesced frame.
+
+        Returns:
+            bool: True if all frames were handed to the writer.
+        """
+        encoded = []
+        for kind, payload in items:
+            if kind == "json":
+                encoded.append(_dumps(payload))
+            elif kind == "text":
+                encoded.append(str(payload))
+            else:
+                raise ValueError(f"Unsupported batch item kind: {kind}")
+
+        frames = []
+        current: List[str] = []
+        current_len = 0
+        for message in encoded:
+            message_len = len(message.encode('utf-8'))
+            if current and current_len + message_len + 1 > max_batch_bytes:
+                frames.append('\n'.join(current))
+                current = []
+                current_len = 0
+            current.append(message)
+            current_len += message_len + 1
+        if current:
+            frames.append('\n'.join(current))
+
+        success = True
+        for frame in frames:
+            success = self.send(frame) and success
+        return success
+
     def send_json(self, data: dict) -> bool:
-        """Send JSON message"""
-        return self.send(data)
-    
+        """Send JSON message (fast path: serialize and enqueue directly)"""
+        return self._enqueue_tx(_dumps(data))
+
     def send_text(self, text: str) -> bool:
-        """Send text message"""
-        return self.send(text)
-    
+        """Send text message (fast path: no type probing)"""
+        return self._enqueue_tx(text)
+
     def send_binary(self, data: bytes) -> bool:
-        """Send binary message"""
-        return self.send(data)
+        """Send binary message (fast path: bytes pass straight through)"""
+        return self._enqueue_tx(data)
+
+    def register_template(self, name: str, payload: dict) -> str:
+        """Pre-serialize a payload sent repeatedly (pings, renewals).
+
+        Fixed control messages otherwise pay the JSON encode on every
+        send; serializing once at registration moves that cost off the
+        hot path entirely.
+
+        Returns:
+            str: The cached encoding.
+        """
+        encoded = _dumps(payload)
+        self._templates[name] = encoded
+        return encoded
+
+    def send_template(self, name: str) -> bool:
+        """Send a registered template; zero serialization per send"""
+        return self._enqueue_tx(self._templates[name])
+
+    def send_prebuilt(self, frame_bytes: bytes) -> bool:
+        """Write a frame built by build_frame() straight to the transport.
+
+        Skips JSON encoding, the writer queue, and the websockets frame
+        writer entirely - the send is one transport.write of bytes that
+        were assembled at registration time. The frame goes out
+        immediately rather than through the writer's coalescing, so it
+        can overtake messages still sitting in the tx buffer; use it for
+        order-insensitive control frames.
+
+        Returns:
+            bool: True if the frame was handed to the transport.
+        """
+        if self.state != ConnectionState.CONNECTED:
+            return False
+        ws = self.websocket
+        transport = getattr(ws, 'transport', None) if ws is not None else None
+        loop = self._loop
+        if transport is None or loop is None or loop.is_closed():
+            self.logger.warning("Transport not available for sending")
+            return False
+        # transport.write is only safe from the loop thread
+        try:
+            running = asyncio.get_running_loop()
+        except RuntimeError:
+            running = None
+        if running is loop:
+            transport.write(frame_bytes)
+        else:
+            loop.call_soon_threadsafe(transport.write, frame_bytes)
+        return True
     
     def is_connected(self) -> bool:
         """Check if connected"""
@@ -220,7 +595,12 @@ class WebSocketClient:
     
     def _run_event_loop(self):
         """Run asyncio event loop in separate thread"""
-        self._loop = asyncio.new_event_loop()
+        if uvloop is not None:
+            # libuv-based loop: selector and transport code runs in C,
+            # roughly halving per-message loop overhead
+            self._loop = uvloop.new_event_loop()
+        else:
+            self._loop = asyncio.new_event_loop()
         asyncio.set_event_loop(self._loop)
         
         try:
@@ -230,6 +610,8 @@ class WebSocketClient:
             if self.on_error:
                 self.on_error(e)
         finally:
+            # Unblock connect() if the attempt never succeeded
+            self._signal_connect_result(False)
             self._loop.close()
     
     async def _connect_and_run(self):
@@ -275,9 +657,11 @@ class WebSocketClient:
         # Create async retry decorator
         retry_decorator = AsyncRetrying(
             stop=stop_strategy,
-            wait=wait_exponential(
+            # Full-jitter backoff: deterministic delays make every client
+            # that dropped in the same outage retry in lockstep and
+            # thundering-herd the server on recovery
+            wait=wait_random_exponential(
                 multiplier=self.reconnect_delay,
-                min=1,
                 max=self.max_reconnect_delay
             ),
             retry=retry_if_exception_type((
@@ -319,6 +703,12 @@ class WebSocketClient:
                             self.logger.error(f"Error in on_error callback: {callback_error}")
                     break
     
+    def _signal_connect_result(self, value: bool):
+        """Resolve the pending connect() future, if any"""
+        fut = self._connected_fut
+        if fut is not None and not fut.done():
+            fut.set_result(value)
+
     async def _establish_connection(self):
         """Establish WebSocket connection"""
         if self._stop_event.is_set():
@@ -327,23 +717,43 @@ class WebSocketClient:
         self.logger.info(f"Connecting to {self.uri}")
         self.state = ConnectionState.CONNECTING
         
-        # Create SSL context for wss://
-        ssl_context = None
-        if self.uri.startswith('wss://'):
-            ssl_context = ssl.create_default_context()
+        # Shared SSL context for wss://
+        ssl_context = _DEFAULT_SSL_CTX if self.uri.startswith('wss://') else None
         
         # Connect to WebSocket
         websocket = await websockets.connect(
             self.uri,
             ssl=ssl_context,
-            ping_interval=self.ping_interval,
+            # In piggyback mode the writer handles keepalive itself
+            ping_interval=None if self.piggyback_ping else self.ping_interval,
             ping_timeout=self.ping_timeout,
-            close_timeout=10
+            close_timeout=10,
+            compression=self.compression,
+            max_size=self.max_message_size
         )
-        
+
+        # Disable Nagle's algorithm: tick-sized messages otherwise sit in
+        # the kernel buffer for up to ~40 ms waiting for delayed ACKs.
+        # This feed is latency-bound, not throughput-bound.
+        transport = getattr(websocket, 'transport', None)
+        sock = transport.get_extra_info('socket') if transport else None
+        if sock is not None:
+            try:
+                sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+                if hasattr(socket, 'TCP_QUICKACK'):
+                    sock.setsockopt(socket.IPPROTO_TCP,
+                                    socket.TCP_QUICKACK, 1)
+            except OSError as e:
+                self.logger.warning(f"Could not set TCP socket options: {e}")
+
+        # Start the writer coroutine for this connection
+        self._tx_wakeup = asyncio.Event()
+        writer_task = asyncio.ensure_future(self._writer_loop())
+
         try:
             self.websocket = websocket
             self.state = ConnectionState.CONNECTED
+            self._signal_connect_result(True)
             self.connection_id = f"ws_{int(time.time())}"
             self.reconnect_attempts = 0
             self.current_reconnect_delay = self.reconnect_delay
@@ -384,33 +794,110 @@ class WebSocketClient:
             # Re-raise to trigger reconnection logic
             raise
         finally:
+            self._tx_wakeup = None
+            writer_task.cancel()
+            try:
+                # Let the cancellation land so no task outlives the loop
+                await writer_task
+            except (asyncio.CancelledError, Exception):
+                pass
             # Close the connection when done
-            if websocket and not (hasattr(websocket, 'closed') and websocket.closed):
+            if websocket and not getattr(websocket, 'closed', False):
                 await websocket.close()
     
     async def _listen_for_messages(self):
         """Listen for incoming messages"""
         try:
             self.logger.info("Starting message listener...")
-            
-            async for message in self.websocket:
-                if self._stop_event.is_set():
+
+            # Pre-bind the hot lookups; at feed rates the per-iteration
+            # attribute reads add up. Callbacks must be registered before
+            # connect for this reason.
+            on_message = self.on_message
+            conn_id = self.connection_id
+            stop_is_set = self._stop_event.is_set
+            recycle = self.recycle_messages
+
+            websocket = self.websocket
+
+            if on_message is None:
+                # No consumer registered (e.g. heartbeat-only session):
+                # drain frames without wrapping or dispatching them
+                async for _ in websocket:
+                    if stop_is_set():
+                        self.logger.info(
+                            "Stop event set, exiting message listener")
+                        break
+                self.logger.info("Message listener loop ended")
+                return
+
+            if not self.decode:
+                # Raw mode: recv(decode=False) hands over the frame
+                # payload as bytes without running the UTF-8 decode
+                recv = websocket.recv
+                while True:
+                    try:
+                        message = await recv(decode=False)
+                    except ConnectionClosedOK:
+                        break
+                    if stop_is_set():
+                        self.logger.info(
+                            "Stop event set, exiting message listener")
+                        break
+                    if recycle:
+                        ws_message = WebSocketMessage._acquire(
+                            message, "binary", conn_id)
+                    else:
+                        ws_message = WebSocketMessage(
+                            data=message,
+                            message_type="binary",
+                            connection_id=conn_id
+                        )
+                    try:
+                        on_message(ws_message)
+                    except Exception as e:
+                        self.logger.error(
+                            f"Error in on_message callback: {e}")
+                    if recycle:
+                        ws_message.release()
+                self.logger.info("Message listener loop ended")
+                return
+
+            # Pull straight from recv() instead of `async for`: iterating
+            # the connection goes through an async generator that adds a
+            # coroutine layer per frame, and recv() resumes inline - with
+            # no event-loop yield - while the protocol still has frames
+            # buffered, so a burst that arrived in one TCP segment is
+            # drained in a single loop wakeup.
+            recv = websocket.recv
+            while True:
+                try:
+                    message = await recv()
+                except ConnectionClosedOK:
+                    break
+                if stop_is_set():
                     self.logger.info("Stop event set, exiting message listener")
                     break
-                
+
                 # Create message wrapper
-                ws_message = WebSocketMessage(
-                    data=message,
-                    message_type="text" if isinstance(message, str) else "binary",
-                    connection_id=self.connection_id
-                )
-                
-                # Trigger message callback
-                if self.on_message:
-                    try:
-                        self.on_message(ws_message)
-                    except Exception as e:
-                        self.logger.error(f"Error in on_message callback: {e}")
+                message_type = "text" if isinstance(message, str) else "binary"
+                if recycle:
+                    ws_message = WebSocketMessage._acquire(
+                        message, message_type, conn_id)
+                else:
+                    ws_message = WebSocketMessage(
+                        data=message,
+                        message_type=message_type,
+                        connection_id=conn_id
+                    )
+
+                # Trigger message callback (known non-None here)
+                try:
+                    on_message(ws_message)
+                except Exception as e:
+                    self.logger.error(f"Error in on_message callback: {e}")
+                if recycle:
+                    ws_message.release()
             
             self.logger.info("Message listener loop ended")
                         
@@ -421,28 +908,344 @@ class WebSocketClient:
             self.logger.error(f"Error listening for messages: {e}")
             raise  # Re-raise to trigger reconnection
     
+    async def _writer_loop(self):
+        """Drain the outgoing queue, coalescing bursts into single frames.
+
+        Each WebSocket frame pays its own TCP/TLS/framing overhead, which
+        dwarfs tick-sized payloads. When several text messages are queued
+        within the same wakeup they are joined newline-delimited (the
+        same convention send_batch uses) and sent as one frame; binary
+        messages are always sent as their own frames.
+        """
+        wakeup = self._tx_wakeup
+        piggyback = self.piggyback_ping and self.ping_interval
+        try:
+            while True:
+                if piggyback:
+                    # Outbound traffic refreshes liveness by itself; only
+                    # an idle send side needs an explicit keepalive frame
+                    try:
+                        await asyncio.wait_for(wakeup.wait(),
+                                               timeout=self.ping_interval)
+                    except asyncio.TimeoutError:
+                        ws = self.websocket
+                        if ws is not None and not getattr(ws, 'closed', False):
+                            await ws.ping()
+                        continue
+                else:
+                    await wakeup.wait()
+                wakeup.clear()
+                while True:
+                    # Swap the whole buffer out under the lock; senders
+                    # that append after this see an empty buffer and
+                    # schedule the next wakeup themselves
+                    with self._tx_lock:
+                        if not self._tx_buf:
+                            break
+                        pending = list(self._tx_buf)
+                        self._tx_buf.clear()
+                    for start in range(0, len(pending),
+                                       self._MAX_TX_BATCH):
+                        await self._flush_batch(
+                            pending[start:start + self._MAX_TX_BATCH])
+        except asyncio.CancelledError:
+            raise
+        except ConnectionClosed:
+            self.logger.info("Writer stopped: connection closed")
+        except Exception as e:
+            self.logger.error(f"Writer loop error: {e}")
+
+    async def _flush_batch(self, batch: List[Union[str, bytes]]):
+        """Send one drained batch, joining runs of text into single frames"""
+        i = 0
+        n = len(batch)
+        while i < n:
+            if isinstance(batch[i], str):
+                j = i + 1
+                while j < n and isinstance(batch[j], str):
+                    j += 1
+                frame = batch[i] if j - i == 1 else '\n'.join(batch[i:j])
+                await self._send_message(frame)
+                i = j
+            else:
+                await self._send_message(batch[i])
+                i += 1
+
     async def _send_message(self, message: Union[str, bytes]):
         """Send message through WebSocket"""
-        if self.websocket and not (hasattr(self.websocket, 'closed') and self.websocket.closed):
-            await self.websocket.send(message)
+        # Single attribute read plus getattr; hasattr costs a full
+        # exception-swallowing lookup per send
+        ws = self.websocket
+        if ws is not None and not getattr(ws, 'closed', False):
+            await ws.send(message)
         else:
             self.logger.warning("WebSocket not available for sending")
     
     async def _send_queued_messages(self):
         """Send queued messages after reconnection"""
-        with self._queue_lock:
-            if self._message_queue:
-                self.logger.info(f"Sending {len(self._message_queue)} queued messages")
-                for message in self._message_queue:
-                    await self._send_message(message)
-                self._message_queue.clear()
+        queue = self._message_queue
+        if queue:
+            self.logger.info(f"Sending {len(queue)} queued messages")
+            while True:
+                try:
+                    message = queue.popleft()
+                except IndexError:
+                    break
+                await self._send_message(message)
     
     
     async def _close_connection(self):
         """Close WebSocket connection"""
-        if self.websocket and not self.websocket.closed:
+        if self.websocket and not getattr(self.websocket, 'closed', False):
             await self.websocket.close()
 
+
+class TradingWebSocketClient(WebSocketClient):
+    """WebSocket client for trading data feeds with subscription management.
+
+    Incoming messages are staged in a bounded drop-oldest queue and handed
+    to the message callback from a dedicated worker thread, so a slow
+    consumer never blocks the socket reader (and stale ticks are dropped
+    rather than back-pressuring the feed).
+    """
+
+    # Maximum messages dispatched per worker wakeup, so a deep backlog
+    # cannot starve the stop check
+    _MAX_DRAIN_BATCH = 256
+
+    def __init__(self,
+                 uri: str,
+                 queue_maxlen: int = 10000,
+                 queue_high_watermark: Optional[Callable[[int], None]] = None,
+                 **kwargs):
+        """
+        Initialize trading WebSocket client
+
+        Args:
+            uri: WebSocket URI (ws:// or wss://)
+            queue_maxlen: Bound of the receive queue; oldest messages are
+                dropped when the consumer falls behind
+            queue_high_watermark: Callback invoked with the running drop
+                count whenever a message is dropped
+            **kwargs: Forwarded to WebSocketClient
+        """
+        if kwargs.get('recycle_messages'):
+            # The internal callback stages messages in the receive queue
+            # past its own return, which breaks the freelist contract -
+            # recycled wrappers would be reused while still queued
+            raise ValueError(
+                "recycle_messages is not supported on "
+                "TradingWebSocketClient")
+        super().__init__(uri, **kwargs)
+        self.queue_high_watermark = queue_high_watermark
+        self._subscriptions: Dict[str, set] = {"quotes": set(), "trades": set()}
+
+        # Bounded staging queue between the socket reader and the consumer
+        self._rx_queue: deque = deque(maxlen=queue_maxlen)
+        self._rx_event = threading.Event()
+        self._rx_stop = threading.Event()
+        self._rx_worker: Optional[threading.Thread] = None
+        self._dropped_messages = 0
+
+        # The base class delivers frames into the queue; the worker thread
+        # forwards them to the user's callback
+        self._user_on_message: Optional[Callable[[WebSocketMessage], None]] = None
+        super().set_on_message(self._enqueue_message)
+
+        # Subscriptions are staged locally and flushed in the same tick as
+        # the connect event, so server frames can never arrive before the
+        # subscription set is registered
+        self._user_on_connect: Optional[Callable] = None
+        super().set_on_connect(self._handle_connect)
+
+    def set_on_message(self, callback: Callable[[WebSocketMessage], None]):
+        """Set message callback (invoked from the consumer worker thread)"""
+        self._user_on_message = callback
+
+    def set_on_connect(self, callback: Callable):
+        """Set connection callback (runs after staged subscriptions are sent)"""
+        self._user_on_connect = callback
+
+    def _handle_connect(self):
+        """Flush staged subscriptions before handing control to the user.
+
+        Runs on the event-loop thread as part of the open event; emitting
+        the whole subscription set as one batched frame here closes the
+        window where server frames could arrive before subscriptions are
+        registered.
+        """
+        items = [("json", {"action": "subscribe", "channel": channel,
+                           "symbols": sorted(symbols)})
+                 for channel, symbols in self._subscriptions.items() if symbols]
+        if items:
+            self.send_batch(items)
+        if self._user_on_connect:
+            try:
+                self._user_on_connect()
+            except Exception as e:
+                self.logger.error(f"Error in on_connect callback: {e}")
+
+    def _enqueue_message(self, message: WebSocketMessage):
+        """Stage a message for the consumer; drops the oldest when full"""
+        queue = self._rx_queue
+        if len(queue) == queue.maxlen:
+            self._dropped_messages += 1
+            if self.queue_high_watermark:
+                try:
+                    self.queue_high_watermark(self._dropped_messages)
+                except Exception as e:
+                    self.logger.error(f"Error in queue_high_watermark callback: {e}")
+        queue.append(message)
+        self._rx_event.set()
+
+    def _drain_loop(self):
+        """Worker loop forwarding staged messages to the user callback"""
+        while not self._rx_stop.is_set():
+            self._rx_event.wait(timeout=0.1)
+            self._rx_event.clear()
+            for _ in range(min(len(self._rx_queue), self._MAX_DRAIN_BATCH)):
+                try:
+                    message = self._rx_queue.popleft()
+                except IndexError:
+                    break
+                if self._user_on_message:
+                    try:
+                        self._user_on_message(message)
+                    except Exception as e:
+                        self.logger.error(f"Error in on_message callback: {e}")
+            if self._rx_queue:
+                # More left than one batch allows - wake up again immediately
+                self._rx_event.set()
+
+    def connect(self) -> bool:
+        """Connect and start the consumer worker thread"""
+        if self._rx_worker is None or not self._rx_worker.is_alive():
+            self._rx_stop.clear()
+            self._rx_worker = threading.Thread(target=self._drain_loop, daemon=True)
+            self._rx_worker.start()
+        return super().connect()
+
+    def disconnect(self):
+        """Disconnect and stop the consumer worker thread"""
+        super().disconnect()
+        self._rx_stop.set()
+        self._rx_event.set()
+        if self._rx_worker and self._rx_worker.is_alive():
+            self._rx_worker.join(timeout=5.0)
+
+    def get_dropped_message_count(self) -> int:
+        """Get the number of messages dropped due to a full receive queue"""
+        return self._dropped_messages
+
+    def _send_subscription(self, action: str, channel: str, symbols: List[str]) -> bool:
+        """Send a subscription control message.
+
+        Before the connection is up the change is only staged (in
+        self._subscriptions, already updated by the caller) and will be
+        flushed by _handle_connect - nothing is queued here, so the flush
+        cannot double-send.
+        """
+        if not symbols:
+            return True
+        if self.state != ConnectionState.CONNECTED:
+            return False
+        return self.send({"action": action, "channel": channel, "symbols": list(symbols)})
+
+    def subscribe_to_quotes(self, symbols: List[str]) -> bool:
+        """Subscribe to quote updates for symbols"""
+        self._subscriptions["quotes"].update(symbols)
+        return self._send_subscription("subscribe", "quotes", symbols)
+
+    def subscribe_to_trades(self, symbols: List[str]) -> bool:
+        """Subscribe to trade updates for symbols"""
+        self._subscriptions["trades"].update(symbols)
+        return self._send_subscription("subscribe", "trades", symbols)
+
+    def unsubscribe_from_quotes(self, symbols: List[str]) -> bool:
+        """Unsubscribe from quote updates for symbols"""
+        self._subscriptions["quotes"].difference_update(symbols)
+        return self._send_subscription("unsubscribe", "quotes", symbols)
+
+    def unsubscribe_from_trades(self, symbols: List[str]) -> bool:
+        """Unsubscribe from trade updates for symbols"""
+        self._subscriptions["trades"].difference_update(symbols)
+        return self._send_subscription("unsubscribe", "trades", symbols)
+
+    def resubscribe_all(self):
+        """Re-send all current subscriptions (e.g. after a reconnect)"""
+        for channel, symbols in self._subscriptions.items():
+            if symbols:
+                self._send_subscription("subscribe", channel, sorted(symbols))
+
+
+class WebSocketClientManager:
+    """Hosts many WebSocket clients on one shared event loop thread.
+
+    One loop thread per connection stops scaling at a few hundred
+    connections and wastes a thread stack apiece; asyncio is built to
+    multiplex. The manager lazily starts a single loop thread and
+    clients constructed with manager=... run on it as ordinary tasks.
+    """
+
+    def __init__(self, logger: Optional[logging.Logger] = None):
+        self.logger = logger or logging.getLogger(__name__)
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+
+    def _ensure_loop(self) -> asyncio.AbstractEventLoop:
+        """Start the shared loop thread on first use"""
+        with self._lock:
+            if self._loop is None or self._loop.is_closed():
+                if uvloop is not None:
+                    self._loop = uvloop.new_event_loop()
+                else:
+                    self._loop = asyncio.new_event_loop()
+                self._thread = threading.Thread(
+                    target=self._run_loop, args=(self._loop,), daemon=True)
+                self._thread.start()
+            return self._loop
+
+    def _run_loop(self, loop: asyncio.AbstractEventLoop):
+        """Run the shared loop until shutdown"""
+        asyncio.set_event_loop(loop)
+        try:
+            loop.run_forever()
+        finally:
+            loop.close()
+
+    def create_client(self, uri: str, **kwargs) -> WebSocketClient:
+        """Create a WebSocketClient hosted on this manager's loop"""
+        return WebSocketClient(uri, manager=self, **kwargs)
+
+    def shutdown(self, timeout: float = 5.0):
+        """Stop the shared loop thread (disconnect clients first)"""
+        with self._lock:
+            loop, thread = self._loop, self._thread
+            self._loop = None
+            self._thread = None
+        if loop is not None and not loop.is_closed():
+            loop.call_soon_threadsafe(loop.stop)
+        if thread is not None and thread.is_alive():
+            thread.join(timeout=timeout)
+
+
+# Factory functions
+def create_websocket_client(uri: str, **kwargs) -> WebSocketClient:
+    """Create a WebSocket client"""
+    return WebSocketClient(uri, **kwargs)
+
+
+def create_trading_websocket_client(uri: str, **kwargs) -> TradingWebSocketClient:
+    """Create a trading WebSocket client"""
+    return TradingWebSocketClient(uri, **kwargs)
+
+
+def create_websocket_client_manager(**kwargs) -> WebSocketClientManager:
+    """Create a manager hosting multiple clients on one loop thread"""
+    return WebSocketClientManager(**kwargs)
+
+
 # Example usage
 if __name__ == "__main__":
     # Example usage